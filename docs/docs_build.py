@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import json
 import os
+import shutil
 import zipfile
 from contextlib import contextmanager
 from functools import cached_property
-from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, Optional
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING, Generator
 
 from docs.logging import Logger
 
 if TYPE_CHECKING:
+    import requests
     from invoke.context import Context
     from packaging import version
 
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Values are substituted as JSON strings, which are also valid (escaped) JS string literals.
+_DATA_JSX_TEMPLATE = """\
+// this file is autogenerated
+export default {{
+  release_version: {release_version},
+  min_python: {min_python},
+  max_python: {max_python},
+}}
+"""
+
 
 class DocsBuilder:
     def __init__(
@@ -42,70 +57,84 @@ class DocsBuilder:
         MIN_PYTHON_VERSION = 3.8
         MAX_PYTHON_VERSION = 3.11
 
-        old_version_file = self._read_prior_release_version_file()
-        self._write_release_version(
-            "\n".join(
-                [
-                    "// this file is autogenerated",
-                    "export default {",
-                    f"  release_version: 'great_expectations, version {version}',",
-                    f"   min_python: '{MIN_PYTHON_VERSION}',",
-                    f"   max_python: '{MAX_PYTHON_VERSION}',",
-                    "}",
-                ]
+        prior_version_file_content = self._read_prior_release_version_file()
+        try:
+            self._write_release_version(
+                _DATA_JSX_TEMPLATE.format(
+                    release_version=json.dumps(
+                        f"great_expectations, version {version}"
+                    ),
+                    min_python=json.dumps(str(MIN_PYTHON_VERSION)),
+                    max_python=json.dumps(str(MAX_PYTHON_VERSION)),
+                )
             )
-        )
 
-        self._invoke_api_docs()
-        self._context.run(f"yarn docusaurus docs:version {version}")
-
-        # process the above
-        os.chdir("..")  # TODO: none of this messing with current directory stuff
-        os.chdir("docusaurus")
-        self._write_release_version(old_version_file)
+            self._invoke_api_docs()
+            self._context.run(f"yarn docusaurus docs:version {version}")
+        finally:
+            self._write_release_version(prior_version_file_content)
 
     @contextmanager
     def _load_zip(self, url: str) -> Generator[zipfile.ZipFile, None, None]:
-        import requests  # imported here to avoid this getting imported before `invoke deps` finishes
-
-        response = requests.get(url)
-        zip_data = BytesIO(response.content)
-        with zipfile.ZipFile(zip_data, "r") as zip_ref:
-            yield zip_ref
+        # zipfile needs to seek to the central directory, so the response is streamed
+        # to a temporary file rather than buffered whole in memory.
+        with self._http.get(url, stream=True) as response, TemporaryFile() as zip_data:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, zip_data, length=_COPY_BUFFER_SIZE)
+            zip_data.seek(0)
+            with zipfile.ZipFile(zip_data, "r") as zip_ref:
+                yield zip_ref
 
     def _invoke_api_docs(self) -> None:
-        """Invokes the invoke api-docs command.
-        If this is a non-PR running on netlify, we use the latest tag. Otherwise, we use the current branch.
-        """
+        """Build the API docs by running the api-docs task from tasks.py in-process."""
+        # imported here since `tasks` only resolves when the repo root is on sys.path
+        from tasks import api_docs
+
         self.logger.print("Invoking api-docs...")
 
-        # TODO: not this: we should do this all in python
-        self._run("(cd ../../; invoke api-docs)")
+        # api-docs must be run from the repo root, which is two levels up from docusaurus
+        with self._pushd(self._current_directory.parent.parent):
+            api_docs(self._context)
+
+    @contextmanager
+    def _pushd(self, path: Path) -> Generator[None, None, None]:
+        """Change the working directory for the duration of the block, restoring it afterwards."""
+        prior_directory = Path.cwd()
+        os.chdir(path)
+        try:
+            yield
+        finally:
+            os.chdir(prior_directory)
 
     def _read_prior_release_version_file(self) -> str:
-        with open(self._release_version_file) as file:
-            return file.read()
+        return self._release_version_file.read_text()
 
     def _write_release_version(self, content: str) -> None:
-        with open(self._release_version_file, "w") as file:
-            file.write(content)
-
-    def _run(self, command: str) -> Optional[str]:
-        result = self._context.run(command, echo=True)
-        if not result:
-            return None
-        elif not result.ok:
-            raise Exception(f"Failed to run command: {command}")  # noqa: TRY002, TRY003
-        return result.stdout.strip()
-
-    def _run_and_get_output(self, command: str) -> str:
-        output = self._run(command)
-        assert output
-        return output
+        self._release_version_file.write_text(content)
 
     @property
-    def _release_version_file(self) -> str:
-        return "./docs/components/_data.jsx"
+    def _release_version_file(self) -> Path:
+        return self._current_directory / "docs/components/_data.jsx"
+
+    @cached_property
+    def _http(self) -> requests.Session:
+        """Shared session so repeated downloads reuse pooled keep-alive connections."""
+        # imported here to avoid these getting imported before `invoke deps` finishes
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.5),
+            ),
+        )
+        return session
 
     @cached_property
     def logger(self) -> Logger:
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import io
+import pathlib
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+from packaging.version import Version
+from requests.adapters import HTTPAdapter
+
+from docs.docs_build import DocsBuilder
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock  # noqa: TID251
+
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def context(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock()
+
+
+@pytest.fixture
+def docs_builder(context: MagicMock, tmp_path: pathlib.Path) -> DocsBuilder:
+    docusaurus_dir = tmp_path / "docs" / "docusaurus"
+    docusaurus_dir.mkdir(parents=True)
+    return DocsBuilder(context=context, current_directory=docusaurus_dir)
+
+
+def test_load_zip_reads_members_from_streamed_response(
+    mocker: MockerFixture, docs_builder: DocsBuilder
+):
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w") as zip_ref:
+        zip_ref.writestr("a.txt", "hello")
+
+    response = mocker.MagicMock()
+    response.raw = io.BytesIO(zip_bytes.getvalue())
+    session = mocker.MagicMock()
+    session.get.return_value.__enter__.return_value = response
+    docs_builder._http = session
+
+    with docs_builder._load_zip("https://example.com/archive.zip") as zip_ref:
+        assert zip_ref.read("a.txt") == b"hello"
+
+    session.get.assert_called_once_with("https://example.com/archive.zip", stream=True)
+
+
+def test_http_session_retries_transient_failures(docs_builder: DocsBuilder):
+    adapter = docs_builder._http.get_adapter("https://example.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.5
+
+
+def test_create_version_restores_release_version_file_on_failure(
+    mocker: MockerFixture, context: MagicMock, docs_builder: DocsBuilder
+):
+    release_version_file = docs_builder._current_directory / "docs/components/_data.jsx"
+    release_version_file.parent.mkdir(parents=True)
+    release_version_file.write_text("original content")
+    mocker.patch.object(docs_builder, "_invoke_api_docs")
+    context.run.side_effect = RuntimeError("yarn failed")
+
+    with pytest.raises(RuntimeError):
+        docs_builder.create_version(version=Version("1.0.0"))
+
+    assert release_version_file.read_text() == "original content"
+
+
+def test_create_version_writes_escaped_release_version(
+    mocker: MockerFixture, docs_builder: DocsBuilder
+):
+    release_version_file = docs_builder._current_directory / "docs/components/_data.jsx"
+    release_version_file.parent.mkdir(parents=True)
+    release_version_file.write_text("original content")
+    mocker.patch.object(docs_builder, "_invoke_api_docs")
+    write_release_version = mocker.spy(docs_builder, "_write_release_version")
+
+    # a plain string stands in for a Version so the rendered value can contain characters
+    # that need escaping
+    docs_builder.create_version(version='1.0.0"\\')  # type: ignore[arg-type]
+
+    assert write_release_version.call_args_list[0].args[0] == (
+        "// this file is autogenerated\n"
+        "export default {\n"
+        '  release_version: "great_expectations, version 1.0.0\\"\\\\",\n'
+        '  min_python: "3.8",\n'
+        '  max_python: "3.11",\n'
+        "}\n"
+    )
+    assert release_version_file.read_text() == "original content"
+
+
+def test_invoke_api_docs_runs_task_from_repo_root(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    context: MagicMock,
+    docs_builder: DocsBuilder,
+):
+    docusaurus_dir = docs_builder._current_directory
+    monkeypatch.chdir(docusaurus_dir)
+    cwd_during_call: list[pathlib.Path] = []
+    api_docs = mocker.patch(
+        "tasks.api_docs", side_effect=lambda ctx: cwd_during_call.append(pathlib.Path.cwd())
+    )
+
+    docs_builder._invoke_api_docs()
+
+    api_docs.assert_called_once_with(context)
+    assert cwd_during_call == [docusaurus_dir.parent.parent]
+    assert pathlib.Path.cwd() == docusaurus_dir
+
+
+def test_invoke_api_docs_restores_cwd_when_task_fails(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, docs_builder: DocsBuilder
+):
+    docusaurus_dir = docs_builder._current_directory
+    monkeypatch.chdir(docusaurus_dir)
+    mocker.patch("tasks.api_docs", side_effect=RuntimeError("api-docs failed"))
+
+    with pytest.raises(RuntimeError):
+        docs_builder._invoke_api_docs()
+
+    assert pathlib.Path.cwd() == docusaurus_dir